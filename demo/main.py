@@ -1,14 +1,16 @@
+import asyncio
 import contextlib
 import json
 import logging
 import os
 import time
+from collections import OrderedDict
 from typing import Any
 
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from langchain.chat_models import init_chat_model
 from mcp.server.fastmcp import FastMCP
@@ -18,6 +20,7 @@ from pydantic import BaseModel
 from etter.datasources import CompositeDataSource, IGNBDCartoSource, PostGISDataSource, SwissNames3DSource
 from etter.datasources.ign_bdcarto import IGN_BDCARTO_TYPE_MAP
 from etter.datasources.swissnames3d import OBJEKTART_TYPE_MAP
+from etter.models import GeoQuery
 from etter.parser import GeoFilterParser
 from etter.spatial import apply_spatial_relation
 
@@ -111,6 +114,30 @@ if not LLM_MODEL:
 llm = init_chat_model(model=LLM_MODEL, temperature=0, api_key=LLM_API_KEY)
 parser = GeoFilterParser(llm, datasource=datasource)
 
+# Parsed queries keyed by query text, so repeated queries skip the LLM round-trip.
+# Only validated, confident parses are stored: a hallucinated relation, a parsing
+# error or a low-confidence result is retried against the LLM on the next request.
+_PARSE_CACHE_SIZE = 1024
+_parse_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
+
+async def _parse_query(query: str) -> GeoQuery:
+    """Parse a query, reusing an earlier successful parse of the same text."""
+    cached = _parse_cache.get(query)
+    if cached is not None:
+        _parse_cache.move_to_end(query)
+        # Rebuild a fresh model: callers may mutate it (e.g. inferred buffer distances).
+        # model_validate rather than model_construct: construct would leave the nested
+        # models as plain dicts, and validating a small dict is negligible next to an LLM call.
+        return GeoQuery.model_validate(cached)
+
+    geo_query = await parser.aparse(query)
+    if geo_query.confidence_breakdown.overall >= parser.confidence_threshold:
+        _parse_cache[query] = geo_query.model_dump()
+        if len(_parse_cache) > _PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+    return geo_query
+
 
 def _build_result_features(geo_query, reference_features: list) -> list:
     """Build a flat list of (search_area, reference) Feature dicts for the given query."""
@@ -137,14 +164,15 @@ async def _run_geo_query(query: str) -> "QueryResponse":
     Raises:
         ValueError: if the reference location is not found in the datasource.
     """
-    geo_query = await parser.aparse(query)
+    geo_query = await _parse_query(query)
     location_name = geo_query.reference_location.name
     features = datasource.search(location_name, type=geo_query.reference_location.type)
     if not features:
         raise ValueError(f"Location '{location_name}' not found")
-    result_features = _build_result_features(geo_query, features)
+    # Shapely/pyproj work runs off the event loop so concurrent requests are not blocked.
+    result_features = await asyncio.to_thread(_build_result_features, geo_query, features)
     feature_collection = {"type": "FeatureCollection", "features": result_features}
-    return QueryResponse(query=query, geo_query=geo_query.model_dump(), result=feature_collection)
+    return QueryResponse(query=query, geo_query=geo_query, result=feature_collection)
 
 
 class QueryRequest(BaseModel):
@@ -153,19 +181,22 @@ class QueryRequest(BaseModel):
 
 class QueryResponse(BaseModel):
     query: str
-    geo_query: dict[str, Any]  # The parsed GeoQuery
+    geo_query: GeoQuery  # Kept as a model so it is serialized in one pass with the response
     result: dict[str, Any]  # GeoJSON FeatureCollection
 
 
 @app.post("/api/query", response_model=QueryResponse)
 async def process_query(request: QueryRequest):
     try:
-        return await _run_geo_query(request.query)
+        response = await _run_geo_query(request.query)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         logger.exception("Error processing query")
         raise HTTPException(status_code=500, detail=str(e))
+    # Encode with pydantic-core directly: returning the model would make FastAPI
+    # re-validate it against response_model and walk it again with jsonable_encoder.
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 @app.post("/api/query/stream")
@@ -200,8 +231,6 @@ async def process_query_stream(request: QueryRequest):
             if geo_query_result:
                 yield f"data: {json.dumps({'type': 'reasoning', 'content': 'Resolving location in database'})}\n\n"
 
-                from etter.models import GeoQuery
-
                 geo_query = GeoQuery.model_validate(geo_query_result)
 
                 location_name = geo_query.reference_location.name
@@ -225,7 +254,7 @@ async def process_query_stream(request: QueryRequest):
                 yield f"data: {json.dumps({'type': 'reasoning', 'content': 'Computing spatial search areas'})}\n\n"
 
                 spatial_start = time.perf_counter()
-                result_features = _build_result_features(geo_query, features)
+                result_features = await asyncio.to_thread(_build_result_features, geo_query, features)
                 spatial_duration = (time.perf_counter() - spatial_start) * 1000
                 yield f"data: {json.dumps({'type': 'reasoning', 'content': 'Computed spatial relations', 'duration_ms': spatial_duration})}\n\n"
 
@@ -125,12 +125,18 @@ OBJEKTART_TYPE_MAP: TypeMap = {
     "viewpoint": ["Aussichtspunkt"],
 }
 
+# Reverse lookup OBJEKTART → type; the first type listing a value wins
+_OBJEKTART_TO_TYPE: dict[str, str] = {}
+for _type_name, _objektart_values in OBJEKTART_TYPE_MAP.items():
+    for _objektart in _objektart_values:
+        _OBJEKTART_TO_TYPE.setdefault(_objektart, _type_name)
+
 
 def _objektart_to_type(objektart: str) -> str:
     """
     Convert OBJEKTART value to normalized type.
 
-    Searches through OBJEKTART_TYPE_MAP to find which type the OBJEKTART belongs to.
+    Looks up which OBJEKTART_TYPE_MAP type the OBJEKTART belongs to.
     Falls back to lowercased raw value if not found.
 
     Args:
@@ -139,11 +145,8 @@ def _objektart_to_type(objektart: str) -> str:
     Returns:
         Normalized type string (e.g., "lake", "city", "mountain")
     """
-    for type_name, objektart_values in OBJEKTART_TYPE_MAP.items():
-        if objektart in objektart_values:
-            return type_name
     # Fallback: return lowercased raw value if not found
-    return objektart.lower()
+    return _OBJEKTART_TO_TYPE.get(objektart) or objektart.lower()
 
 
 def _normalize_name(name: str) -> str:
@@ -186,6 +189,10 @@ class SwissNames3DSource:
         self._layer = layer
         self._gdf: gpd.GeoDataFrame | None = None
         self._name_index: dict[str, list[int]] = {}
+        # Column names resolved once per load
+        self._name_col = ""
+        self._type_col: str | None = None
+        self._id_col: str | None = None
 
     def _ensure_loaded(self) -> None:
         """Load data lazily on first access."""
@@ -205,43 +212,37 @@ class SwissNames3DSource:
                 kwargs["layer"] = self._layer
             self._gdf = gpd.read_file(str(self._data_path), **kwargs)
 
+        self._name_col = self._detect_name_column()
+        self._type_col = self._detect_type_column()
+        self._id_col = self._detect_id_column()
         self._build_name_index()
 
     def _load_from_directory(self) -> None:
         """Load and concatenate all SwissNames3D shapefiles from a directory."""
         # Look for the 3 standard SwissNames3D shapefiles
         shapefile_names = ["swissNAMES3D_PKT", "swissNAMES3D_LIN", "swissNAMES3D_PLY"]
-        gdfs: list[gpd.GeoDataFrame] = []
-
-        for name in shapefile_names:
-            shp_path = self._data_path / f"{name}.shp"
-            if shp_path.exists():
-                gdf = gpd.read_file(str(shp_path))
-                gdfs.append(gdf)
+        shp_paths = [self._data_path / f"{name}.shp" for name in shapefile_names]
+        shp_paths = [path for path in shp_paths if path.exists()]
 
-        if not gdfs:
+        if not shp_paths:
             raise ValueError(
                 f"No SwissNames3D shapefiles found in {self._data_path}. Expected: {', '.join(shapefile_names)}"
             )
 
-        # Find common columns across all loaded GeoDataFrames
-        common_cols = set(gdfs[0].columns)
-        for gdf in gdfs[1:]:
-            common_cols &= set(gdf.columns)
+        # Peek at one row per file to find the columns shared by all files, then load only
+        # those, rather than reading every column and dropping the extras after the fact
+        common_cols = set.intersection(*(set(gpd.read_file(str(path), rows=1).columns) for path in shp_paths))
+        common_cols.discard("geometry")
+        gdfs = [gpd.read_file(str(path), columns=sorted(common_cols)) for path in shp_paths]
 
-        # Keep only common columns and concatenate
-        gdfs_filtered = [gdf[sorted(common_cols)] for gdf in gdfs]
-        self._gdf = gpd.GeoDataFrame(
-            gpd.pd.concat(gdfs_filtered, ignore_index=True), crs=gdfs[0].crs, geometry="geometry"
-        )
+        self._gdf = gpd.GeoDataFrame(gpd.pd.concat(gdfs, ignore_index=True), crs=gdfs[0].crs, geometry="geometry")
 
     def _build_name_index(self) -> None:
         """Build a normalized name → row indices lookup for fast search."""
         assert self._gdf is not None
         self._name_index = {}
 
-        name_col = self._detect_name_column()
-        for idx, name in enumerate(self._gdf[name_col]):
+        for idx, name in enumerate(self._gdf[self._name_col]):
             if not isinstance(name, str) or not name.strip():
                 continue
             normalized = _normalize_name(name)
@@ -273,22 +274,28 @@ class SwissNames3DSource:
                 return candidate
         return None
 
+    def _row_type(self, idx: int) -> str:
+        """Return the normalized type of a row without touching its geometry."""
+        assert self._gdf is not None
+        type_col = self._type_col
+        raw_type = self._gdf[type_col].iat[idx] if type_col else None
+        return _objektart_to_type(str(raw_type) if raw_type else "unknown")
+
     def _row_to_feature(self, idx: int) -> Feature:
         """Convert a GeoDataFrame row to a GeoJSON Feature dict with WGS84 geometry."""
         assert self._gdf is not None
         row = self._gdf.iloc[idx]
 
         # Get name
-        name_col = self._detect_name_column()
+        name_col = self._name_col
         name = str(row[name_col])
 
         # Get type
-        type_col = self._detect_type_column()
-        raw_type = str(row[type_col]) if type_col and row.get(type_col) else "unknown"
-        normalized_type = _objektart_to_type(raw_type)
+        type_col = self._type_col
+        normalized_type = self._row_type(idx)
 
         # Get ID
-        id_col = self._detect_id_column()
+        id_col = self._id_col
         feature_id = str(row[id_col]) if id_col and row.get(id_col) else str(idx)
 
         # Convert geometry to WGS84 GeoJSON
@@ -356,20 +363,17 @@ class SwissNames3DSource:
         if not indices:
             indices = self._fuzzy_search(normalized)
 
-        features = [self._row_to_feature(idx) for idx in indices]
-
         # Filter by type if type hint provided.
         # Expand via the type hierarchy so that category hints (e.g. "water") match
         # all concrete types within that category ("lake", "river", "pond", ...).
+        # Unknown type hints fall back to an exact string match.
+        # Candidates are pruned on the raw rows so that only the returned features
+        # pay for geometry reprojection and GeoJSON conversion.
         if type is not None:
-            matching_types = get_matching_types(type)
-            if matching_types:
-                features = [f for f in features if f["properties"].get("type") in matching_types]
-            else:
-                # Unknown type hint, fall back to exact string match
-                features = [f for f in features if f["properties"].get("type") == type.lower()]
+            matching_types = get_matching_types(type) or [type.lower()]
+            indices = [idx for idx in indices if self._row_type(idx) in matching_types]
 
-        return features[:max_results]
+        return [self._row_to_feature(idx) for idx in indices[:max_results]]
 
     def _fuzzy_search(self, normalized: str, threshold: float = 75.0) -> list[int]:
         """
@@ -420,7 +424,7 @@ class SwissNames3DSource:
         self._ensure_loaded()
         assert self._gdf is not None
 
-        id_col = self._detect_id_column()
+        id_col = self._id_col
         if id_col:
             matches = self._gdf[self._gdf[id_col].astype(str) == feature_id]
             if not matches.empty:
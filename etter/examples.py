@@ -9,6 +9,8 @@ These examples cover:
 - Activity queries (demonstrating scope - activities are ignored)
 """
 
+import functools
+from collections import defaultdict
 from dataclasses import dataclass
 
 from .models import (
@@ -282,10 +284,23 @@ EXAMPLES: list[ExampleQuery] = [
 ]
 
 
+# Partition examples once at import so lookups by language/category are plain dict reads.
+_BY_LANGUAGE: dict[str, list[ExampleQuery]] = defaultdict(list)
+_BY_CATEGORY: dict[str, list[ExampleQuery]] = defaultdict(list)
+for _ex in EXAMPLES:
+    _BY_LANGUAGE[_ex.language].append(_ex)
+    _BY_CATEGORY[_ex.output.spatial_relation.category].append(_ex)
+del _ex
+
+
+@functools.cache
 def format_examples_for_prompt() -> str:
     """
     Format examples as text for inclusion in LLM prompt.
 
+    ``EXAMPLES`` is a module-level constant, so the result is computed once and
+    cached for the lifetime of the process.
+
     Returns:
         Formatted string with all examples
     """
@@ -311,7 +326,7 @@ def get_examples_by_language(language: str) -> list[ExampleQuery]:
     Returns:
         List of examples in the specified language
     """
-    return [ex for ex in EXAMPLES if ex.language == language]
+    return list(_BY_LANGUAGE.get(language, ()))
 
 
 def get_examples_by_category(category: str) -> list[ExampleQuery]:
@@ -324,4 +339,4 @@ def get_examples_by_category(category: str) -> list[ExampleQuery]:
     Returns:
         List of examples using that category
     """
-    return [ex for ex in EXAMPLES if ex.output.spatial_relation.category == category]
+    return list(_BY_CATEGORY.get(category, ()))
@@ -16,6 +16,14 @@ ConfidenceLevel = Annotated[float, Field(ge=0.0, le=1.0, description="Confidence
 RelationCategory = Literal["containment", "buffer", "directional", "clipping"]
 GeometryFormat = Literal["geojson", "wkt", "wkb"]
 
+# Whether each relation category requires a buffer_config (True) or forbids one (False).
+_CATEGORY_REQUIRES_BUFFER: dict[str, bool] = {
+    "containment": False,
+    "buffer": True,
+    "directional": True,
+    "clipping": False,
+}
+
 
 class ConfidenceScore(BaseModel):
     """Confidence scores for different aspects of the parsed query."""
@@ -152,17 +160,14 @@ class GeoQuery(BaseModel):
     @model_validator(mode="after")
     def validate_buffer_config_consistency(self) -> "GeoQuery":
         """Validate buffer_config consistency with relation category."""
+        category = self.spatial_relation.category
+        requires_buffer = _CATEGORY_REQUIRES_BUFFER[category]
+        if requires_buffer == (self.buffer_config is not None):
+            return self
+
         # Buffer and directional relations must have buffer_config
-        if self.spatial_relation.category in ("buffer", "directional") and self.buffer_config is None:
-            raise ValueError(
-                f"{self.spatial_relation.category} relation '{self.spatial_relation.relation}' requires buffer_config"
-            )
+        if requires_buffer:
+            raise ValueError(f"{category} relation '{self.spatial_relation.relation}' requires buffer_config")
 
         # Containment and clipping relations should not have buffer_config
-        if self.spatial_relation.category in ("containment", "clipping") and self.buffer_config is not None:
-            raise ValueError(
-                f"{self.spatial_relation.category} relation '{self.spatial_relation.relation}' "
-                f"should not have buffer_config"
-            )
-
-        return self
+        raise ValueError(f"{category} relation '{self.spatial_relation.relation}' should not have buffer_config")
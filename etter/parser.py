@@ -2,6 +2,7 @@
 Main parser class for natural language geographic query parsing.
 """
 
+import logging
 from collections.abc import AsyncGenerator
 
 from langchain_core.language_models import BaseChatModel
@@ -14,6 +15,8 @@ from .prompts import build_prompt_template
 from .spatial_config import SpatialRelationConfig
 from .validators import validate_query
 
+logger = logging.getLogger(__name__)
+
 
 class GeoFilterParser:
     """
@@ -128,6 +131,17 @@ class GeoFilterParser:
             )
 
         assert isinstance(parsed, GeoQuery), "Parsed result must be GeoQuery"
+
+        # The prompt is a static prefix followed by the query, so providers with
+        # prefix caching (e.g. OpenAI) should report cache hits after the first call.
+        usage = getattr(response.get("raw"), "usage_metadata", None) if isinstance(response, dict) else None
+        if usage:
+            logger.debug(
+                "LLM input tokens: %s (cached: %s)",
+                usage.get("input_tokens"),
+                (usage.get("input_token_details") or {}).get("cache_read", 0),
+            )
+
         return parsed
 
     def _finalize(self, geo_query: GeoQuery, query: str) -> GeoQuery:
@@ -2,6 +2,8 @@
 Prompt templates and builders for LLM query parsing.
 """
 
+import functools
+
 from langchain_core.prompts import ChatPromptTemplate
 
 from .examples import format_examples_for_prompt
@@ -126,6 +128,10 @@ def build_prompt_template(
     """
     Build complete prompt template with system message, examples, and user message.
 
+    Only the final user message depends on the query. Everything before it is
+    identical across calls, which lets providers with automatic prompt caching
+    (e.g. OpenAI) reuse the static prefix.
+
     Args:
         spatial_config: Spatial relation configuration for injecting available relations
         include_examples: Whether to include few-shot examples (default: True)
@@ -166,15 +172,7 @@ When inferring type, prefer these concrete types for better matching."""
 
     # Few-shot examples (optional but recommended)
     if include_examples:
-        examples_text = format_examples_for_prompt()
-        examples_message = f"""EXAMPLES:
-
-The following examples demonstrate correct parsing for various query types:
-
-{examples_text}"""
-        # Escape braces for ChatPromptTemplate
-        examples_message = examples_message.replace("{", "{{").replace("}", "}}")
-        messages.append(("system", examples_message))
+        messages.append(("system", _examples_message()))
 
     # User message template - only this has a placeholder for format_messages
     messages.append(("user", USER_TEMPLATE))
@@ -182,6 +180,22 @@ The following examples demonstrate correct parsing for various query types:
     return ChatPromptTemplate.from_messages(messages)
 
 
+@functools.cache
+def _examples_message() -> str:
+    """
+    Build the few-shot examples system message, with braces escaped for ChatPromptTemplate.
+
+    The examples are static, so the message is built once per process and shared
+    by every parser instance.
+    """
+    examples_message = f"""EXAMPLES:
+
+The following examples demonstrate correct parsing for various query types:
+
+{format_examples_for_prompt()}"""
+    return examples_message.replace("{", "{{").replace("}", "}}")
+
+
 def format_spatial_relations(config: SpatialRelationConfig) -> str:
     """
     Format spatial relations for prompt injection.
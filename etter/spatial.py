@@ -6,12 +6,16 @@ All inputs and outputs are GeoJSON dicts in WGS84 (EPSG:4326).
 Shapely is used internally for geometry operations.
 """
 
+import functools
+
+import numpy as np
+import shapely
 from pyproj import Geod, Transformer
 from shapely.geometry import MultiLineString, box, mapping, shape
 from shapely.geometry.base import BaseGeometry
 from shapely.geometry.linestring import LineString
 from shapely.geometry.polygon import Polygon
-from shapely.ops import linemerge, transform, unary_union
+from shapely.ops import linemerge, unary_union
 
 from .geometry_format import convert_geometry
 from .models import BufferConfig, GeoJsonGeometry, GeometryFormat, SpatialRelation
@@ -21,10 +25,14 @@ _DEFAULT_SPATIAL_CONFIG = SpatialRelationConfig()  # Module-level singleton for
 _GEOD = Geod(ellps="WGS84")  # Geodesic calculator for accurate area and arc computation.
 
 
+@functools.lru_cache(maxsize=256)
 def _local_transformers(lon: float, lat: float) -> tuple[Transformer, Transformer]:
     """Return (to_local, to_wgs84) Transformers for an azimuthal equidistant CRS
     centred at (lon, lat).  Distances in the local CRS are in metres with low
     distortion within a few hundred kilometres of the centre point.
+
+    Building a Transformer means a PROJ pipeline lookup, so results are cached:
+    repeated queries for the same reference location share the same centroid.
     """
     aeqd = f"+proj=aeqd +lat_0={lat} +lon_0={lon} +datum=WGS84 +units=m"
     to_local = Transformer.from_crs("EPSG:4326", aeqd, always_xy=True)
@@ -32,6 +40,16 @@ def _local_transformers(lon: float, lat: float) -> tuple[Transformer, Transforme
     return to_local, to_wgs84
 
 
+def _reproject(geom: BaseGeometry, transformer: Transformer) -> BaseGeometry:
+    """Reproject a geometry with a single vectorized pyproj call over all its coordinates.
+
+    Unlike ``shapely.ops.transform``, which calls back into Python once per
+    coordinate sequence (ring, part), this hands the full (N, 2) coordinate
+    array to PROJ at once.
+    """
+    return shapely.transform(geom, lambda coords: np.column_stack(transformer.transform(coords[:, 0], coords[:, 1])))
+
+
 # Area thresholds in m² used for distance inference from geometry size.
 # Brackets: point/tiny (<1 km²), small (1–50 km²), medium (50–500 km²), large (>500 km²)
 _AREA_DISTANCE_BRACKETS: list[tuple[float, int]] = [
@@ -118,7 +136,7 @@ def apply_spatial_relation(
 
     A list of geometries is unioned into one before the transformation, so that
     features split across multiple datasource records (e.g. a river in segments)
-    produce a single coherent search area.
+    produce a single coherent search area. Exact duplicates are dropped first.
 
     When ``buffer_config.inferred`` is True (i.e. no explicit distance was
     stated), the buffer distance is refined from the actual geometry area so
@@ -135,11 +153,27 @@ def apply_spatial_relation(
     Returns:
         Transformed geometry in the requested format.
     """
+    # Containment is a passthrough: a single reference geometry needs no Shapely work.
+    if relation.category == "containment" and not isinstance(geometry, list):
+        return convert_geometry(geometry, geometry_format)
+
     if isinstance(geometry, list):
         if not geometry:
             raise ValueError("geometry list must not be empty")
-        geom = unary_union([shape(g) for g in geometry])
-        geom_dict: GeoJsonGeometry = mapping(geom)
+        # Drop exact duplicates (keyed on WKB) so repeated records of the same
+        # feature do not inflate the union.
+        unique: dict[bytes, tuple[BaseGeometry, GeoJsonGeometry]] = {}
+        for g in geometry:
+            s = shape(g)
+            unique.setdefault(s.wkb, (s, g))
+        # A lone point or polygon is already dissolved, so the union is skipped.
+        # Multi-part and line geometries still go through it: their parts may
+        # overlap or cross and must be noded/dissolved before buffering.
+        if len(unique) == 1 and next(iter(unique.values()))[0].geom_type in ("Point", "Polygon"):
+            geom, geom_dict = next(iter(unique.values()))
+        else:
+            geom = unary_union([s for s, _ in unique.values()])
+            geom_dict = mapping(geom)
     else:
         geom = shape(geometry)
         geom_dict = geometry
@@ -218,7 +252,7 @@ def _apply_buffer(geom: BaseGeometry, config: BufferConfig) -> GeoJsonGeometry:
     cx, cy = geom.centroid.x, geom.centroid.y
     to_local, to_wgs84 = _local_transformers(cx, cy)
 
-    geom_local = transform(to_local.transform, geom)
+    geom_local = _reproject(geom, to_local)
 
     if config.buffer_from == "center":
         buffered_local = geom_local.centroid.buffer(abs(config.distance_m))
@@ -234,7 +268,7 @@ def _apply_buffer(geom: BaseGeometry, config: BufferConfig) -> GeoJsonGeometry:
     if buffered_local.is_empty:
         return mapping(geom)  # Fallback if erosion eliminates geometry
 
-    return mapping(transform(to_wgs84.transform, buffered_local))
+    return mapping(_reproject(buffered_local, to_wgs84))
 
 
 def _collect_line_parts(geom: BaseGeometry) -> list[LineString]:
@@ -2,14 +2,19 @@
 Spatial relation configuration and built-in relation definitions.
 """
 
+import bisect
 from dataclasses import dataclass
 from typing import Literal, get_args
 
 from .exceptions import UnknownRelationError
 from .models import RelationCategory
 
+# Shared defaults for every directional relation: 10km radius, 90° sector
+_DIRECTIONAL_DISTANCE_M = 10000
+_DIRECTIONAL_SECTOR_DEGREES = 90
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class RelationConfig:
     """
     Configuration for a single spatial relation.
@@ -37,6 +42,204 @@ class RelationConfig:
     clip_direction: Literal["north", "south", "east", "west"] | None = None
 
 
+# Built-in spatial relations from ARCHITECTURE.md
+_BUILTIN_RELATIONS: tuple[RelationConfig, ...] = (
+    # ===== CONTAINMENT RELATIONS =====
+    RelationConfig(
+        name="in",
+        category="containment",
+        description="Feature is within the reference boundary",
+    ),
+    # ===== BUFFER/PROXIMITY RELATIONS =====
+    RelationConfig(
+        name="near",
+        category="buffer",
+        description="Proximity search with default 5km radius",
+        default_distance_m=5000,
+        buffer_from="center",
+    ),
+    RelationConfig(
+        name="on_shores_of",
+        category="buffer",
+        description="Ring buffer around lake/water boundary, excluding the water body itself",
+        default_distance_m=1000,
+        buffer_from="boundary",
+        ring_only=True,
+    ),
+    RelationConfig(
+        name="along",
+        category="buffer",
+        description="Buffer following a linear feature like a river or road",
+        default_distance_m=500,
+        buffer_from="boundary",
+    ),
+    RelationConfig(
+        name="left_bank",
+        category="buffer",
+        description="Left bank of a linear feature (river, road) relative to its direction/flow",
+        default_distance_m=500,
+        buffer_from="boundary",
+        side="left",
+    ),
+    RelationConfig(
+        name="right_bank",
+        category="buffer",
+        description="Right bank of a linear feature (river, road) relative to its direction/flow",
+        default_distance_m=500,
+        buffer_from="boundary",
+        side="right",
+    ),
+    RelationConfig(
+        name="in_the_heart_of",
+        category="buffer",
+        description="Central area excluding periphery (negative buffer - erosion)",
+        default_distance_m=-500,
+        buffer_from="boundary",
+    ),
+    RelationConfig(
+        name="bordering",
+        category="buffer",
+        description="Thin ring just outside the reference boundary, for land-border adjacency queries (e.g. 'cities bordering Germany')",
+        default_distance_m=2000,
+        buffer_from="boundary",
+        ring_only=True,
+    ),
+    # ===== CLIPPING RELATIONS =====
+    # Clip the reference geometry to a directional half-plane using bbox intersection.
+    # These answer "what is in the northern/southern/eastern/western portion of X?"
+    # as opposed to directional relations which answer "what is north/south/etc. of X?".
+    RelationConfig(
+        name="northern_part_of",
+        category="clipping",
+        description="Northern half of the reference geometry (bbox clip to upper half)",
+        clip_direction="north",
+    ),
+    RelationConfig(
+        name="southern_part_of",
+        category="clipping",
+        description="Southern half of the reference geometry (bbox clip to lower half)",
+        clip_direction="south",
+    ),
+    RelationConfig(
+        name="eastern_part_of",
+        category="clipping",
+        description="Eastern half of the reference geometry (bbox clip to right half)",
+        clip_direction="east",
+    ),
+    RelationConfig(
+        name="western_part_of",
+        category="clipping",
+        description="Western half of the reference geometry (bbox clip to left half)",
+        clip_direction="west",
+    ),
+    # ===== DIRECTIONAL RELATIONS =====
+    # All directional relations use consistent defaults:
+    # - Distance: 10km radius (default_distance_m=10000)
+    # - Sector: 90° angular wedge (sector_angle_degrees=90)
+    # - Origin: Centroid of reference location (buffer_from="center" set in enrich_with_defaults)
+    # These defaults are applied automatically by enrich_with_defaults() for any directional query.
+    # Convention: 0° = North, angles increase clockwise (90° = East, 180° = South, 270° = West)
+    RelationConfig(
+        name="north_of",
+        category="directional",
+        description="Directional sector north of reference",
+        default_distance_m=_DIRECTIONAL_DISTANCE_M,
+        sector_angle_degrees=_DIRECTIONAL_SECTOR_DEGREES,
+        direction_angle_degrees=0,
+    ),
+    RelationConfig(
+        name="south_of",
+        category="directional",
+        description="Directional sector south of reference",
+        default_distance_m=_DIRECTIONAL_DISTANCE_M,
+        sector_angle_degrees=_DIRECTIONAL_SECTOR_DEGREES,
+        direction_angle_degrees=180,
+    ),
+    RelationConfig(
+        name="east_of",
+        category="directional",
+        description="Directional sector east of reference",
+        default_distance_m=_DIRECTIONAL_DISTANCE_M,
+        sector_angle_degrees=_DIRECTIONAL_SECTOR_DEGREES,
+        direction_angle_degrees=90,
+    ),
+    RelationConfig(
+        name="west_of",
+        category="directional",
+        description="Directional sector west of reference",
+        default_distance_m=_DIRECTIONAL_DISTANCE_M,
+        sector_angle_degrees=_DIRECTIONAL_SECTOR_DEGREES,
+        direction_angle_degrees=270,
+    ),
+    # ===== DIAGONAL DIRECTIONAL RELATIONS =====
+    RelationConfig(
+        name="northeast_of",
+        category="directional",
+        description="Directional sector northeast of reference",
+        default_distance_m=_DIRECTIONAL_DISTANCE_M,
+        sector_angle_degrees=_DIRECTIONAL_SECTOR_DEGREES,
+        direction_angle_degrees=45,
+    ),
+    RelationConfig(
+        name="southeast_of",
+        category="directional",
+        description="Directional sector southeast of reference",
+        default_distance_m=_DIRECTIONAL_DISTANCE_M,
+        sector_angle_degrees=_DIRECTIONAL_SECTOR_DEGREES,
+        direction_angle_degrees=135,
+    ),
+    RelationConfig(
+        name="southwest_of",
+        category="directional",
+        description="Directional sector southwest of reference",
+        default_distance_m=_DIRECTIONAL_DISTANCE_M,
+        sector_angle_degrees=_DIRECTIONAL_SECTOR_DEGREES,
+        direction_angle_degrees=225,
+    ),
+    RelationConfig(
+        name="northwest_of",
+        category="directional",
+        description="Directional sector northwest of reference",
+        default_distance_m=_DIRECTIONAL_DISTANCE_M,
+        sector_angle_degrees=_DIRECTIONAL_SECTOR_DEGREES,
+        direction_angle_degrees=315,
+    ),
+)
+
+
+def _format_relation(rel: RelationConfig) -> str:
+    """Format a single relation as its two-line prompt entry."""
+    # Build distance info
+    dist_info = ""
+    if rel.default_distance_m is not None:
+        dist_str = f"{abs(rel.default_distance_m)}m"
+        if rel.default_distance_m < 0:
+            dist_info = f" (default: {dist_str} erosion)"
+        else:
+            dist_info = f" (default: {dist_str})"
+
+    # Build special flags
+    flags = []
+    if rel.ring_only:
+        flags.append("ring buffer")
+    if rel.buffer_from:
+        flags.append(f"from {rel.buffer_from}")
+    if rel.side:
+        flags.append(f"{rel.side} side only")
+    flag_info = f" [{', '.join(flags)}]" if flags else ""
+
+    return f"  • {rel.name}{dist_info}{flag_info}\n    {rel.description}"
+
+
+# Registry state for the built-ins, computed once and copied into each SpatialRelationConfig
+_BUILTIN_BY_NAME: dict[str, RelationConfig] = {rel.name: rel for rel in _BUILTIN_RELATIONS}
+_BUILTIN_BY_CATEGORY: dict[str, list[str]] = {
+    category: sorted(rel.name for rel in _BUILTIN_RELATIONS if rel.category == category)
+    for category in get_args(RelationCategory)
+}
+_BUILTIN_PROMPT_FRAGMENTS: dict[str, str] = {rel.name: _format_relation(rel) for rel in _BUILTIN_RELATIONS}
+
+
 class SpatialRelationConfig:
     """
     Registry and configuration for spatial relations.
@@ -47,289 +250,100 @@ class SpatialRelationConfig:
     def __init__(self):
         """Initialize with built-in spatial relations."""
         self.relations: dict[str, RelationConfig] = {}
+        # Snapshot of the relations the derived state below was built from; a mismatch
+        # means ``relations`` was edited directly and triggers a rebuild (see _sync_index)
+        self._indexed_relations: dict[str, RelationConfig] = {}
+        # Sorted relation names per category
+        self._by_category: dict[str, list[str]] = {category: [] for category in get_args(RelationCategory)}
+        # Prompt entry per relation, formatted once at registration
+        self._prompt_fragments: dict[str, str] = {}
+        self._prompt_cache: str | None = None
+        self._available_str: str | None = None
         self._initialize_defaults()
 
     def _initialize_defaults(self):
         """Register built-in spatial relations from ARCHITECTURE.md."""
-
-        # ===== CONTAINMENT RELATIONS =====
-        self.register_relation(
-            RelationConfig(
-                name="in",
-                category="containment",
-                description="Feature is within the reference boundary",
-            )
-        )
-
-        # ===== BUFFER/PROXIMITY RELATIONS =====
-        self.register_relation(
-            RelationConfig(
-                name="near",
-                category="buffer",
-                description="Proximity search with default 5km radius",
-                default_distance_m=5000,
-                buffer_from="center",
-            )
-        )
-
-        self.register_relation(
-            RelationConfig(
-                name="on_shores_of",
-                category="buffer",
-                description="Ring buffer around lake/water boundary, excluding the water body itself",
-                default_distance_m=1000,
-                buffer_from="boundary",
-                ring_only=True,
-            )
-        )
-
-        self.register_relation(
-            RelationConfig(
-                name="along",
-                category="buffer",
-                description="Buffer following a linear feature like a river or road",
-                default_distance_m=500,
-                buffer_from="boundary",
-            )
-        )
-
-        self.register_relation(
-            RelationConfig(
-                name="left_bank",
-                category="buffer",
-                description="Left bank of a linear feature (river, road) relative to its direction/flow",
-                default_distance_m=500,
-                buffer_from="boundary",
-                side="left",
-            )
-        )
-
-        self.register_relation(
-            RelationConfig(
-                name="right_bank",
-                category="buffer",
-                description="Right bank of a linear feature (river, road) relative to its direction/flow",
-                default_distance_m=500,
-                buffer_from="boundary",
-                side="right",
-            )
-        )
-
-        self.register_relation(
-            RelationConfig(
-                name="in_the_heart_of",
-                category="buffer",
-                description="Central area excluding periphery (negative buffer - erosion)",
-                default_distance_m=-500,
-                buffer_from="boundary",
-            )
-        )
-
-        self.register_relation(
-            RelationConfig(
-                name="bordering",
-                category="buffer",
-                description="Thin ring just outside the reference boundary, for land-border adjacency queries (e.g. 'cities bordering Germany')",
-                default_distance_m=2000,
-                buffer_from="boundary",
-                ring_only=True,
-            )
-        )
-
-        # ===== CLIPPING RELATIONS =====
-        # Clip the reference geometry to a directional half-plane using bbox intersection.
-        # These answer "what is in the northern/southern/eastern/western portion of X?"
-        # as opposed to directional relations which answer "what is north/south/etc. of X?".
-        self.register_relation(
-            RelationConfig(
-                name="northern_part_of",
-                category="clipping",
-                description="Northern half of the reference geometry (bbox clip to upper half)",
-                clip_direction="north",
-            )
-        )
-
-        self.register_relation(
-            RelationConfig(
-                name="southern_part_of",
-                category="clipping",
-                description="Southern half of the reference geometry (bbox clip to lower half)",
-                clip_direction="south",
-            )
-        )
-
-        self.register_relation(
-            RelationConfig(
-                name="eastern_part_of",
-                category="clipping",
-                description="Eastern half of the reference geometry (bbox clip to right half)",
-                clip_direction="east",
-            )
-        )
-
-        self.register_relation(
-            RelationConfig(
-                name="western_part_of",
-                category="clipping",
-                description="Western half of the reference geometry (bbox clip to left half)",
-                clip_direction="west",
-            )
-        )
-
-        # ===== DIRECTIONAL RELATIONS =====
-        # All directional relations use consistent defaults:
-        # - Distance: 10km radius (default_distance_m=10000)
-        # - Sector: 90° angular wedge (sector_angle_degrees=90)
-        # - Origin: Centroid of reference location (buffer_from="center" set in enrich_with_defaults)
-        # These defaults are applied automatically by enrich_with_defaults() for any directional query.
-        # Convention: 0° = North, angles increase clockwise (90° = East, 180° = South, 270° = West)
-        self.register_relation(
-            RelationConfig(
-                name="north_of",
-                category="directional",
-                description="Directional sector north of reference",
-                default_distance_m=10000,
-                sector_angle_degrees=90,
-                direction_angle_degrees=0,
-            )
-        )
-
-        self.register_relation(
-            RelationConfig(
-                name="south_of",
-                category="directional",
-                description="Directional sector south of reference",
-                default_distance_m=10000,
-                sector_angle_degrees=90,
-                direction_angle_degrees=180,
-            )
-        )
-
-        self.register_relation(
-            RelationConfig(
-                name="east_of",
-                category="directional",
-                description="Directional sector east of reference",
-                default_distance_m=10000,
-                sector_angle_degrees=90,
-                direction_angle_degrees=90,
-            )
-        )
-
-        self.register_relation(
-            RelationConfig(
-                name="west_of",
-                category="directional",
-                description="Directional sector west of reference",
-                default_distance_m=10000,
-                sector_angle_degrees=90,
-                direction_angle_degrees=270,
-            )
-        )
-
-        # ===== DIAGONAL DIRECTIONAL RELATIONS =====
-        self.register_relation(
-            RelationConfig(
-                name="northeast_of",
-                category="directional",
-                description="Directional sector northeast of reference",
-                default_distance_m=10000,
-                sector_angle_degrees=90,
-                direction_angle_degrees=45,
-            )
-        )
-
-        self.register_relation(
-            RelationConfig(
-                name="southeast_of",
-                category="directional",
-                description="Directional sector southeast of reference",
-                default_distance_m=10000,
-                sector_angle_degrees=90,
-                direction_angle_degrees=135,
-            )
-        )
-
-        self.register_relation(
-            RelationConfig(
-                name="southwest_of",
-                category="directional",
-                description="Directional sector southwest of reference",
-                default_distance_m=10000,
-                sector_angle_degrees=90,
-                direction_angle_degrees=225,
-            )
-        )
-
-        self.register_relation(
-            RelationConfig(
-                name="northwest_of",
-                category="directional",
-                description="Directional sector northwest of reference",
-                default_distance_m=10000,
-                sector_angle_degrees=90,
-                direction_angle_degrees=315,
-            )
-        )
+        # Copy the precomputed state rather than re-registering each relation
+        self.relations.update(_BUILTIN_BY_NAME)
+        self._indexed_relations.update(_BUILTIN_BY_NAME)
+        for category, names in _BUILTIN_BY_CATEGORY.items():
+            self._by_category[category].extend(names)
+        self._prompt_fragments.update(_BUILTIN_PROMPT_FRAGMENTS)
+
+    def _sync_index(self) -> None:
+        """Rebuild the derived per-category, prompt and name caches if ``relations`` was edited directly."""
+        if self._indexed_relations == self.relations:
+            return
+        self._by_category = {category: [] for category in get_args(RelationCategory)}
+        self._prompt_fragments = {}
+        for rel in self.relations.values():
+            bisect.insort(self._by_category.setdefault(rel.category, []), rel.name)
+            self._prompt_fragments[rel.name] = _format_relation(rel)
+        self._indexed_relations = dict(self.relations)
+        self._prompt_cache = None
+        self._available_str = None
 
     def register_relation(self, config: RelationConfig) -> None:
         """Register a new spatial relation."""
+        self._sync_index()
+        previous = self.relations.get(config.name)
+        if previous is not None:
+            self._by_category[previous.category].remove(previous.name)
         self.relations[config.name] = config
+        self._indexed_relations[config.name] = config
+        bisect.insort(self._by_category.setdefault(config.category, []), config.name)
+        self._prompt_fragments[config.name] = _format_relation(config)
+        self._prompt_cache = None
+        self._available_str = None
 
     def has_relation(self, name: str) -> bool:
         """Check if a relation is registered."""
         return name in self.relations
 
+    def try_get_config(self, name: str) -> RelationConfig | None:
+        """Get configuration for a relation, or None if it is not registered."""
+        return self.relations.get(name)
+
+    def available_relations_str(self) -> str:
+        """Comma-separated, sorted relation names for error messages (cached until the next registration)."""
+        self._sync_index()
+        if self._available_str is None:
+            self._available_str = ", ".join(sorted(self.relations))
+        return self._available_str
+
     def get_config(self, name: str) -> RelationConfig:
         """Get configuration for a relation. Raises UnknownRelationError if not found."""
-        if not self.has_relation(name):
+        config = self.relations.get(name)
+        if config is None:
             raise UnknownRelationError(
-                f"Unknown spatial relation: '{name}'. Available relations: {', '.join(sorted(self.relations.keys()))}",
+                f"Unknown spatial relation: '{name}'. Available relations: {self.available_relations_str()}",
                 relation_name=name,
             )
-        return self.relations[name]
+        return config
 
     def list_relations(self, category: RelationCategory | None = None) -> list[str]:
         """List available relation names."""
         if category is None:
             return sorted(self.relations.keys())
-        return sorted(r.name for r in self.relations.values() if r.category == category)
+        self._sync_index()
+        return list(self._by_category.get(category, ()))
 
     def format_for_prompt(self) -> str:
-        """Format relations for inclusion in LLM prompt."""
+        """Format relations for inclusion in LLM prompt (cached until the next registration)."""
+        self._sync_index()
+        if self._prompt_cache is not None:
+            return self._prompt_cache
+
         lines = []
 
         # Group by category
-        for category in get_args(RelationCategory):
-            category_relations = [r for r in self.relations.values() if r.category == category]
-            if not category_relations:
+        for category, names in self._by_category.items():
+            if not names:
                 continue
 
             lines.append(f"\n{category.upper()} RELATIONS:")
 
-            for rel in sorted(category_relations, key=lambda r: r.name):
-                # Build distance info
-                dist_info = ""
-                if rel.default_distance_m is not None:
-                    dist_str = f"{abs(rel.default_distance_m)}m"
-                    if rel.default_distance_m < 0:
-                        dist_info = f" (default: {dist_str} erosion)"
-                    else:
-                        dist_info = f" (default: {dist_str})"
-
-                # Build special flags
-                flags = []
-                if rel.ring_only:
-                    flags.append("ring buffer")
-                if rel.buffer_from:
-                    flags.append(f"from {rel.buffer_from}")
-                if rel.side:
-                    flags.append(f"{rel.side} side only")
-                flag_info = f" [{', '.join(flags)}]" if flags else ""
-
-                # Format line
-                lines.append(f"  • {rel.name}{dist_info}{flag_info}")
-                lines.append(f"    {rel.description}")
+            lines.extend(self._prompt_fragments[name] for name in names)
 
         # Add notes
         lines.append("\nNOTES:")
@@ -338,4 +352,5 @@ class SpatialRelationConfig:
         lines.append("  • Buffer from 'center' vs 'boundary' determines buffer origin")
         lines.append("  • Clipping relations return a sub-area of the reference geometry (not a buffer outward)")
 
-        return "\n".join(lines)
+        self._prompt_cache = "\n".join(lines)
+        return self._prompt_cache
@@ -6,7 +6,7 @@ import warnings
 
 from .exceptions import LowConfidenceError, LowConfidenceWarning, NoReferenceLocationError, UnknownRelationError
 from .models import BufferConfig, GeoQuery
-from .spatial_config import SpatialRelationConfig
+from .spatial_config import RelationConfig, SpatialRelationConfig
 
 
 def validate_reference_location_present(geo_query: GeoQuery) -> None:
@@ -23,7 +23,7 @@ def validate_reference_location_present(geo_query: GeoQuery) -> None:
         raise NoReferenceLocationError("Query has no named geographic reference location.")
 
 
-def validate_spatial_relation(geo_query: GeoQuery, spatial_config: SpatialRelationConfig) -> None:
+def validate_spatial_relation(geo_query: GeoQuery, spatial_config: SpatialRelationConfig) -> RelationConfig:
     """
     Validate that the spatial relation is registered in configuration.
 
@@ -31,18 +31,22 @@ def validate_spatial_relation(geo_query: GeoQuery, spatial_config: SpatialRelati
         geo_query: Parsed query to validate
         spatial_config: Spatial relation configuration
 
+    Returns:
+        Configuration of the registered relation
+
     Raises:
         UnknownRelationError: If spatial relation is not registered
     """
     relation_name = geo_query.spatial_relation.relation
 
-    if not spatial_config.has_relation(relation_name):
-        available = ", ".join(sorted(spatial_config.list_relations()))
+    relation_config = spatial_config.try_get_config(relation_name)
+    if relation_config is None:
         raise UnknownRelationError(
             f"Unknown spatial relation: '{relation_name}'. "
-            f"This may be an LLM hallucination. Available relations: {available}",
+            f"This may be an LLM hallucination. Available relations: {spatial_config.available_relations_str()}",
             relation_name=relation_name,
         )
+    return relation_config
 
 
 def enrich_with_defaults(geo_query: GeoQuery, spatial_config: SpatialRelationConfig) -> GeoQuery:
@@ -63,31 +67,37 @@ def enrich_with_defaults(geo_query: GeoQuery, spatial_config: SpatialRelationCon
         Enriched GeoQuery with defaults applied
     """
     relation_config = spatial_config.get_config(geo_query.spatial_relation.relation)
+    return _apply_relation_defaults(geo_query, relation_config)
+
 
+def _apply_relation_defaults(geo_query: GeoQuery, relation_config: RelationConfig) -> GeoQuery:
+    """Apply defaults from an already resolved relation config (see enrich_with_defaults)."""
     # Enrich buffer and directional relations
     if relation_config.category not in ("buffer", "directional"):
         return geo_query
 
+    explicit_distance = geo_query.spatial_relation.explicit_distance
+    buffer_config = geo_query.buffer_config
+
     # Step 1: ensure buffer_config exists, filled with config defaults.
-    if geo_query.buffer_config is None:
-        geo_query.buffer_config = BufferConfig(
-            distance_m=relation_config.default_distance_m or 5000,
+    # An explicitly stated distance always wins over the config default.
+    if buffer_config is None:
+        buffer_config = geo_query.buffer_config = BufferConfig(
+            distance_m=(relation_config.default_distance_m or 5000) if explicit_distance is None else explicit_distance,
             buffer_from=relation_config.buffer_from or "center",
             ring_only=relation_config.ring_only,
-            inferred=True,
+            inferred=explicit_distance is None,
         )
+    elif explicit_distance is not None:
+        buffer_config.distance_m = explicit_distance
+        buffer_config.inferred = False
     # If buffer_config exists but distance is a sentinel zero, fill from config default.
-    elif geo_query.buffer_config.inferred and geo_query.buffer_config.distance_m == 0:
-        geo_query.buffer_config.distance_m = relation_config.default_distance_m or 5000
+    elif buffer_config.inferred and buffer_config.distance_m == 0:
+        buffer_config.distance_m = relation_config.default_distance_m or 5000
 
     # Step 2: propagate side from relation config.
     if relation_config.side is not None:
-        geo_query.buffer_config.side = relation_config.side
-
-    # Step 3: if the user explicitly stated a distance, override whatever was set above.
-    if geo_query.spatial_relation.explicit_distance is not None:
-        geo_query.buffer_config.distance_m = geo_query.spatial_relation.explicit_distance
-        geo_query.buffer_config.inferred = False
+        buffer_config.side = relation_config.side
 
     return geo_query
 
@@ -110,19 +120,21 @@ def validate_buffer_config_consistency(geo_query: GeoQuery) -> None:
     # Most validation is handled by Pydantic @model_validator
     # Additional checks can be added here:
 
+    distance_m = geo_query.buffer_config.distance_m
+    if -5000 <= distance_m <= 100000:
+        return  # Common case: nothing to warn about
+
     # Example: Check for excessively large buffers
-    if abs(geo_query.buffer_config.distance_m) > 100000:  # 100km
+    if abs(distance_m) > 100000:  # 100km
         warnings.warn(
-            f"Large buffer distance: {geo_query.buffer_config.distance_m}m. "
-            f"This may be intentional but could cause performance issues.",
+            f"Large buffer distance: {distance_m}m. This may be intentional but could cause performance issues.",
             UserWarning,
         )
 
     # Example: Check for very small negative buffers that might eliminate geometry
-    if geo_query.buffer_config.distance_m < -5000:  # -5km erosion
+    if distance_m < -5000:  # -5km erosion
         warnings.warn(
-            f"Large negative buffer: {geo_query.buffer_config.distance_m}m. "
-            f"This may completely eliminate the reference geometry.",
+            f"Large negative buffer: {distance_m}m. This may completely eliminate the reference geometry.",
             UserWarning,
         )
 
@@ -203,11 +215,11 @@ def validate_query(
     # 0. Validate reference location is present
     validate_reference_location_present(geo_query)
 
-    # 1. Validate spatial relation
-    validate_spatial_relation(geo_query, spatial_config)
+    # 1. Validate spatial relation (resolves its config once for the next step)
+    relation_config = validate_spatial_relation(geo_query, spatial_config)
 
     # 2. Enrich with defaults
-    geo_query = enrich_with_defaults(geo_query, spatial_config)
+    geo_query = _apply_relation_defaults(geo_query, relation_config)
 
     # 3. Validate buffer config
     validate_buffer_config_consistency(geo_query)
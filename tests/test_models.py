@@ -46,6 +46,12 @@ def test_reference_location():
     assert location.name == "Lausanne"
 
 
+def test_reference_location_keeps_datasource_type():
+    """Type hints are free-form so datasource-specific values (e.g. raw PostGIS types) survive."""
+    location = ReferenceLocation(name="Köniz", type="gemeinde")
+    assert location.type == "gemeinde"
+
+
 def test_buffer_config_valid():
     """Test valid buffer config."""
     config = BufferConfig(
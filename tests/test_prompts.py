@@ -29,3 +29,15 @@ def test_additional_instructions_in_prompt():
     examples_idx = next((i for i, c in enumerate(message_contents) if "EXAMPLES" in c), None)
     if examples_idx is not None:
         assert instructions_idx < examples_idx, "additional_instructions should appear before the few-shot examples"
+
+
+def test_query_only_in_last_message():
+    """Only the last message varies with the query, keeping a cacheable static prefix."""
+    parser = GeoFilterParser(llm=MockLLM())
+
+    first = parser.prompt.format_messages(query="near Lake Geneva")
+    second = parser.prompt.format_messages(query="north of Bern")
+
+    assert [m.content for m in first[:-1]] == [m.content for m in second[:-1]]
+    assert "near Lake Geneva" in first[-1].content
+    assert "north of Bern" in second[-1].content
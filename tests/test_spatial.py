@@ -5,7 +5,7 @@ Tests for spatial operations module.
 from shapely.geometry import LineString, Point, Polygon, mapping, shape
 
 from etter.models import BufferConfig, SpatialRelation
-from etter.spatial import apply_spatial_relation
+from etter.spatial import _local_transformers, apply_spatial_relation
 
 
 def test_containment_passthrough():
@@ -71,6 +71,20 @@ def test_ring_buffer():
     assert not res_shape.contains(Point(0, 0))  # Should NOT contain center (hole)
 
 
+def test_buffer_reuses_local_transformers():
+    """Repeated buffers around the same reference reuse the cached local projection."""
+    geom = {"type": "Point", "coordinates": [6.63, 46.52]}
+    relation = SpatialRelation(relation="near", category="buffer")
+    config = BufferConfig(distance_m=1000, buffer_from="center", inferred=False)
+
+    first = apply_spatial_relation(geom, relation, config)
+    hits = _local_transformers.cache_info().hits
+    second = apply_spatial_relation(geom, relation, config)
+
+    assert _local_transformers.cache_info().hits == hits + 1
+    assert first == second
+
+
 def test_directional_sector():
     """Test directional sector generation."""
     geom = {"type": "Point", "coordinates": [0, 0]}
@@ -196,6 +210,32 @@ def test_list_input_single_matches_dict():
     )
 
 
+def test_list_input_duplicates_dropped():
+    """Duplicate geometries in the list give the same result as a single geometry."""
+    geom = {"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]]}
+    relation = SpatialRelation(relation="in", category="containment")
+
+    assert apply_spatial_relation([geom, dict(geom)], relation) == apply_spatial_relation(geom, relation)
+
+
+def test_list_input_single_multipart_dissolved():
+    """A single multi-part record is still dissolved, so overlapping parts do not survive."""
+    overlapping = {
+        "type": "MultiPolygon",
+        "coordinates": [
+            [[[0, 0], [2, 0], [2, 2], [0, 2], [0, 0]]],
+            [[[1, 1], [3, 1], [3, 3], [1, 3], [1, 1]]],
+        ],
+    }
+    relation = SpatialRelation(relation="in", category="containment")
+
+    result = shape(apply_spatial_relation([overlapping], relation))
+
+    assert result.geom_type == "Polygon"
+    assert result.is_valid
+    assert abs(result.area - 7.0) < 1e-9
+
+
 def test_list_input_empty_raises():
     """Empty list raises ValueError."""
     import pytest
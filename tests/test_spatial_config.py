@@ -2,16 +2,22 @@
 Tests for spatial relation configuration.
 """
 
+import dataclasses
+
 import pytest
 
 from etter.exceptions import UnknownRelationError
 from etter.spatial_config import RelationConfig, SpatialRelationConfig
 
 
-def test_default_relations_loaded():
-    """Test that default relations are initialized."""
-    config = SpatialRelationConfig()
+@pytest.fixture(scope="module")
+def config():
+    """Default registry shared by the read-only tests; tests that register relations build their own."""
+    return SpatialRelationConfig()
+
 
+def test_default_relations_loaded(config):
+    """Test that default relations are initialized."""
     # Check containment relations
     assert config.has_relation("in")
 
@@ -34,24 +40,34 @@ def test_default_relations_loaded():
     assert config.has_relation("northwest_of")
 
 
-def test_get_config():
+def test_get_config(config):
     """Test getting configuration for a relation."""
-    config = SpatialRelationConfig()
-
     near_config = config.get_config("near")
     assert near_config.name == "near"
     assert near_config.category == "buffer"
     assert near_config.default_distance_m == 5000
 
 
-def test_get_unknown_relation():
+def test_get_unknown_relation(config):
     """Test that unknown relation raises error."""
-    config = SpatialRelationConfig()
-
     with pytest.raises(UnknownRelationError) as exc_info:
         config.get_config("unknown_relation")
 
     assert "unknown_relation" in str(exc_info.value)
+    assert config.try_get_config("unknown_relation") is None
+
+
+def test_available_relations_refreshed_on_register():
+    """Test that the available-relations listing picks up newly registered relations."""
+    config = SpatialRelationConfig()
+
+    assert "very_close" not in config.available_relations_str()
+
+    config.register_relation(RelationConfig(name="very_close", category="buffer", description="Very close"))
+
+    assert "very_close" in config.available_relations_str()
+    with pytest.raises(UnknownRelationError, match="very_close"):
+        config.get_config("unknown_relation")
 
 
 def test_register_custom_relation():
@@ -73,20 +89,22 @@ def test_register_custom_relation():
     assert retrieved.default_distance_m == 500
 
 
-def test_list_relations():
-    """Test listing relations."""
-    config = SpatialRelationConfig()
+def test_relation_config_is_immutable(config):
+    """Test that registered relation configs cannot be modified in place."""
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.get_config("near").default_distance_m = 1  # type: ignore[misc]
+
 
+def test_list_relations(config):
+    """Test listing relations."""
     all_relations = config.list_relations()
     assert "in" in all_relations
     assert "near" in all_relations
     assert "north_of" in all_relations
 
 
-def test_list_relations_by_category():
+def test_list_relations_by_category(config):
     """Test listing relations filtered by category."""
-    config = SpatialRelationConfig()
-
     containment = config.list_relations(category="containment")
     assert "in" in containment
     assert "near" not in containment
@@ -96,10 +114,54 @@ def test_list_relations_by_category():
     assert "in" not in buffer
 
 
-def test_format_for_prompt():
-    """Test formatting relations for LLM prompt."""
+def test_replaced_relation_moves_category():
+    """Test that re-registering a relation under another category updates the listings."""
     config = SpatialRelationConfig()
 
+    config.register_relation(RelationConfig(name="near", category="containment", description="Redefined"))
+
+    assert config.list_relations(category="containment") == ["in", "near"]
+    assert "near" not in config.list_relations(category="buffer")
+    assert config.list_relations().count("near") == 1
+
+
+def test_direct_relations_edit_is_listed():
+    """Test that relations added straight to the dict appear in category listings and the prompt."""
+    config = SpatialRelationConfig()
+    config.format_for_prompt()  # Populate the caches first
+
+    config.relations["very_close"] = RelationConfig(name="very_close", category="buffer", description="Very close")
+
+    assert "very_close" in config.list_relations(category="buffer")
+    assert "very_close" in config.format_for_prompt()
+    assert "very_close" in config.available_relations_str()
+
+
+def test_register_after_direct_edit_changes_category():
+    """Test that re-registering a relation edited directly in the dict does not fail."""
+    config = SpatialRelationConfig()
+    config.relations["very_close"] = RelationConfig(name="very_close", category="buffer", description="Very close")
+
+    config.register_relation(RelationConfig(name="very_close", category="containment", description="Redefined"))
+
+    assert "very_close" in config.list_relations(category="containment")
+    assert "very_close" not in config.list_relations(category="buffer")
+
+
+def test_register_after_direct_delete_has_no_duplicates():
+    """Test that re-registering a relation deleted from the dict lists it once."""
+    config = SpatialRelationConfig()
+    near = config.get_config("near")
+    del config.relations["near"]
+
+    config.register_relation(near)
+
+    assert config.list_relations(category="buffer").count("near") == 1
+    assert config.format_for_prompt().count("• near ") == 1
+
+
+def test_format_for_prompt(config):
+    """Test formatting relations for LLM prompt."""
     formatted = config.format_for_prompt()
 
     # Should include category headers
@@ -116,10 +178,29 @@ def test_format_for_prompt():
     assert "Negative distances" in formatted
 
 
-def test_directional_angles():
-    """Test that directional relations have correct angle values."""
+def test_format_for_prompt_refreshed_on_register():
+    """Test that registering a relation invalidates the cached prompt text."""
     config = SpatialRelationConfig()
 
+    before = config.format_for_prompt()
+    assert config.format_for_prompt() is before
+
+    config.register_relation(
+        RelationConfig(
+            name="across_from",
+            category="buffer",
+            description="Opposite side of a water body",
+            default_distance_m=2000,
+        )
+    )
+
+    after = config.format_for_prompt()
+    assert "across_from" not in before
+    assert "across_from" in after
+
+
+def test_directional_angles(config):
+    """Test that directional relations have correct angle values."""
     # Cardinal directions (0° = North, clockwise)
     assert config.get_config("north_of").direction_angle_degrees == 0
     assert config.get_config("east_of").direction_angle_degrees == 90
@@ -4,6 +4,7 @@ Tests for SwissNames3DSource using both synthetic fixture and real shapefiles.
 
 from pathlib import Path
 
+import geopandas as gpd
 import pytest
 
 from etter.datasources import SwissNames3DSource
@@ -87,6 +88,22 @@ def test_search_with_type_filter(source):
     assert results_city[0]["properties"]["name"] == "Bern"
 
 
+def test_search_only_materializes_returned_features(source, monkeypatch):
+    """Type filtering and max_results are applied before rows are converted to features."""
+    calls = []
+    original = source._row_to_feature
+    monkeypatch.setattr(source, "_row_to_feature", lambda idx: calls.append(idx) or original(idx))
+
+    results = source.search("Bern", type="city")
+    assert len(results) == 1
+    assert len(calls) == 1
+
+    calls.clear()
+    results = source.search("Bern", max_results=1)
+    assert len(results) == 1
+    assert len(calls) == 1
+
+
 def test_coordinate_conversion(source):
     """Test that coordinates are converted to WGS84."""
     city = source.search("Bern", type="city")[0]
@@ -138,6 +155,20 @@ def test_search_type_exact_still_works(source):
     assert len(results_none) == 0
 
 
+def test_load_from_directory_common_columns(tmp_path):
+    """Only columns shared by every shapefile in the directory are loaded."""
+    gdf = gpd.read_file(FIXTURE_PATH)
+    gdf[gdf.geom_type == "Point"].to_file(tmp_path / "swissNAMES3D_PKT.shp")
+    gdf[gdf.geom_type == "Polygon"].drop(columns=["EINWOHNER"]).to_file(tmp_path / "swissNAMES3D_PLY.shp")
+
+    source = SwissNames3DSource(tmp_path)
+    source._ensure_loaded()
+
+    assert "EINWOHNER" not in source._gdf.columns
+    assert {"UUID", "NAME", "OBJEKTART", "geometry"} <= set(source._gdf.columns)
+    assert len(source.search("Bern")) == 2
+
+
 # Tests for real SwissNames3D shapefiles
 
 
@@ -18,6 +18,7 @@ from etter.spatial_config import SpatialRelationConfig
 from etter.validators import (
     check_confidence_threshold,
     enrich_with_defaults,
+    validate_buffer_config_consistency,
     validate_query,
     validate_reference_location_present,
     validate_spatial_relation,
@@ -98,9 +99,10 @@ def test_validate_query_raises_for_missing_location(spatial_config):
 
 
 def test_validate_known_relation(spatial_config, sample_query):
-    """Test validation passes for known relation."""
+    """Test validation passes for known relation and returns its config."""
     # Should not raise
-    validate_spatial_relation(sample_query, spatial_config)
+    relation_config = validate_spatial_relation(sample_query, spatial_config)
+    assert relation_config is spatial_config.get_config(sample_query.spatial_relation.relation)
 
 
 def test_validate_unknown_relation(spatial_config, sample_query):
@@ -180,6 +182,26 @@ def test_enrich_explicit_distance(spatial_config):
     assert enriched.buffer_config.inferred is False
 
 
+@pytest.mark.parametrize(
+    ("distance_m", "expected"),
+    [(5000, None), (-5000, None), (100000, None), (150000, "Large buffer distance"), (-6000, "Large negative buffer")],
+)
+def test_buffer_config_consistency_warnings(sample_query, distance_m, expected):
+    """Test that only distances outside the sane range emit a warning."""
+    sample_query.buffer_config = BufferConfig(distance_m=distance_m, buffer_from="boundary")
+
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+        validate_buffer_config_consistency(sample_query)
+
+    messages = [str(warning.message) for warning in w]
+    if expected is None:
+        assert messages == []
+    else:
+        assert len(messages) == 1
+        assert expected in messages[0]
+
+
 def test_confidence_above_threshold(sample_query):
     """Test that good confidence passes."""
     sample_query.confidence_breakdown.overall = 0.90